@@ -160,7 +160,9 @@ def main():
         # display reconstructed images
         reconstructed_images.show(title = 'Reconstructed images (magnitude)')
 
-    diff = backprojected_data/b_norm - reconstructed_images/r_norm
+    # compute the scaled difference in one pass without intermediate containers
+    diff = backprojected_data.sapyb \
+        (1.0/b_norm, reconstructed_images, -1.0/r_norm)
     print('norm of backprojected - reconstructed images: %f' % diff.norm())
 
 try:
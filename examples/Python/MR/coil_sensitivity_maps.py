@@ -12,6 +12,9 @@ Options:
                               subfolder of SIRF root folder
   -i <iter>, --iter=<iter>    number of smoothing iterations [default: 10]
   -e <engn>, --engine=<engn>  reconstruction engine [default: Gadgetron]
+  --dtype=<d>                 precision of NumPy coil maps calculation,
+                              complex64 or complex128 [default: complex64]
+  --verify                    check fill & as_array compatibility
   --non-interactive           do not show plots
 '''
 
@@ -38,6 +41,14 @@ __version__ = '0.1.0'
 from docopt import docopt
 args = docopt(__doc__, version=__version__)
 
+import numpy
+try:
+    # required by Inati method
+    import ismrmrdtools.coils
+    HAVE_INATI = True
+except:
+    HAVE_INATI = False
+
 from sirf.Utilities import error, examples_data_path, existing_filepath, show_3D_array
 
 # import engine module
@@ -51,11 +62,57 @@ if data_path is None:
     data_path = examples_data_path('MR')
 nit = int(args['--iter'])
 show_plot = not args['--non-interactive']
+verify = args['--verify']
+dtype = args['--dtype']
+
+def inati_csm(coil_images, ks=5, niter=3, dtype=numpy.complex64):
+    '''
+    Vectorised NumPy computation of coil sensitivity maps following
+    Inati et al. (see main() for the reference): the map at each pixel is
+    the dominant eigenvector of the coil covariance matrix over a ks x ks
+    patch, found by power iterations done for all pixels at once.
+    The maps have unit norm over coils wherever the coil images are non-zero.
+    coil_images: complex array of coil images of shape (nc, nz, ny, nx)
+    ks         : patch size
+    niter      : number of power iterations
+    dtype      : complex type used in the calculation and for the result
+    '''
+    from numpy.lib.stride_tricks import sliding_window_view
+    h = ks//2
+    # pixel-major layout (nz, ny, nx, nc) padded in y and x
+    cis = numpy.moveaxis(coil_images.astype(dtype, copy=False), 0, -1)
+    # maps do not depend on the scale of coil images, normalise to avoid
+    # underflow in single precision
+    scale = numpy.amax(numpy.abs(cis))
+    if scale > 0:
+        cis = cis/scale
+    cis = numpy.pad(cis, ((0, 0), (h, h), (h, h), (0, 0)))
+    # views of shape (nz, ny, nx, nc, ks, ks) on the patches around each pixel
+    patches = sliding_window_view(cis, (ks, ks), axis=(1, 2))
+    conj_patches = sliding_window_view(cis.conj(), (ks, ks), axis=(1, 2))
+    # coil covariance matrices for all pixels at once
+    cov = numpy.einsum('zyxcij,zyxdij->zyxcd', patches, conj_patches)
+    tiny = numpy.finfo(dtype).tiny
+    # scale each matrix by its trace to keep power iterations in range
+    trace = numpy.einsum('zyxcc->zyx', cov).real
+    cov /= numpy.maximum(trace, tiny)[..., None, None]
+    v = cov.sum(axis=-1)
+    for i in range(niter):
+        v /= numpy.maximum(numpy.linalg.norm(v, axis=-1, keepdims=True), tiny)
+        v = numpy.einsum('zyxcd,zyxd->zyxc', cov, v)
+    v /= numpy.maximum(numpy.linalg.norm(v, axis=-1, keepdims=True), tiny)
+    # remove the arbitrary phase of the eigenvectors
+    v *= numpy.exp(-1j*numpy.angle(v.sum(axis=-1, keepdims=True)))
+    return numpy.moveaxis(v, -1, 0).astype(dtype, copy=False)
 
 def main():
 
     # 1. Prepare data:
 
+    # check the precision requested for NumPy coil maps calculation
+    if dtype not in ('complex64', 'complex128'):
+        raise error('dtype must be complex64 or complex128, got %s' % dtype)
+    #
     # locate the input data file
     input_file = existing_filepath(data_path, data_file)
     #
@@ -84,36 +141,62 @@ def main():
     print('A) calculating from raw data...')
     CSMs.calculate(processed_data)
     #
-    # check fill & as_array compatibility
-    zero = CSMs - CSMs.fill(CSMs.as_array())
-    print('CSMs - CSMs.fill(CSMs.as_array()) = %f' % zero.norm())
-    if show_plot:
-        # display coil sensitivity maps
+    # copy coil sensitivity maps to a numpy array only if needed
+    # and then reuse it
+    if verify or show_plot:
         csms_array = CSMs.as_array()
+    if verify:
+        # check fill & as_array compatibility
+        zero = numpy.linalg.norm(csms_array - CSMs.fill(csms_array).as_array())
+        print('CSMs - CSMs.fill(CSMs.as_array()) = %f' % zero)
+    if show_plot:
+        # allocate the magnitude buffer once, it is reused for all displays
         nz = csms_array.shape[1]
+        csms_slice = csms_array[:, nz//2, :, :]
+        mag = numpy.empty(csms_slice.shape, dtype=numpy.float32)
+        # display coil sensitivity maps
+        numpy.abs(csms_slice, out=mag)
         title = 'SRSS from raw data (magnitude)'
-        show_3D_array(abs(csms_array[:, nz//2, :, :]), suptitle=title, \
+        show_3D_array(mag, suptitle=title, \
                 xlabel='samples', ylabel='readouts', label='coil', show=False)
 
     # 3. Now compute coil sensitivity maps from coil images in order to compare
     # SSRS and Inati methods:
 
-    # create coil images object
+    # create coil images object and compute coil images just once:
+    # they are shared by SRSS and Inati calculations below
     CIs = mr.CoilImagesData()
+    CIs.calculate(processed_data)
     # calculate coil sensitivity maps by dividing each coil image data by the
     # Square-Root-of-the-Sum-of-Squares over all coils (SRSS);
     # (niter = nit) sets the number of smoothing iterations applied
     # to the image data prior to the calculation of the coil sensitivity maps
-    CIs.calculate(processed_data)
     CSs = mr.CoilSensitivityData()
     print('B) calculating from coil images...')
     CSs.calculate(CIs, method='SRSS(niter=%d)' % nit)
     diff = CSs - CSMs
     print('difference between A and B: %f' % diff.norm())
 
-    try:
-        from ismrmrdtools import coils
-    except:
+    # the same kind of calculation as Inati method done by vectorised NumPy code
+    print('C) calculating from coil images by NumPy version of Inati method...')
+    cis_array = CIs.as_array()
+    np_csms_array = inati_csm(cis_array, dtype=dtype)
+    csms_norm = numpy.linalg.norm(np_csms_array, axis=0)
+    csms_norm = csms_norm[csms_norm > 0]
+    msg = 'NumPy coil maps norm over coils: min %f, max %f, must be 1'
+    if numpy.allclose(csms_norm, 1, atol=1e-4):
+        msg += ' - ok'
+    else:
+        msg += ' - ???'
+    print(msg % (csms_norm.min(), csms_norm.max()))
+    if show_plot:
+        nz = np_csms_array.shape[1]
+        numpy.abs(np_csms_array[:, nz//2, :, :], out=mag)
+        title = 'Inati by NumPy (magnitude)'
+        show_3D_array(mag, suptitle=title, \
+                xlabel='samples', ylabel='readouts', label='coil', show=False)
+
+    if not HAVE_INATI:
         print('Inati method requires ismrmrd-python-tools')
         if show_plot:
             import matplotlib.pyplot as plt
@@ -129,17 +212,26 @@ def main():
     print('A) calculating from raw data...')
     CSMs.calculate(processed_data, method='Inati()')
     print('B) calculating from coil images...')
+    # coil images computed for SRSS are reused, no need to recompute them
     CSs.calculate(CIs, method='Inati()')
     if show_plot:
         csms_array = CSMs.as_array()
         nz = csms_array.shape[1]
         #
         # display coil sensitivity maps
+        numpy.abs(csms_array[:, nz//2, :, :], out=mag)
         title = 'Inati (magnitude)'
-        show_3D_array(abs(csms_array[:, nz//2, :, :]), suptitle=title, \
+        show_3D_array(mag, suptitle=title, \
                   xlabel='samples', ylabel='readouts', label='coil')
     diff = CSs - CSMs
     print('difference between A and B: %f' % diff.norm())
+    #
+    # Inati method maps are defined up to a phase factor, hence the NumPy maps
+    # are compared with the engine ones by magnitude
+    cs_array = CSs.as_array()
+    diff = numpy.linalg.norm(abs(np_csms_array) - abs(cs_array)) / \
+           numpy.linalg.norm(cs_array)
+    print('relative difference between magnitudes of B and C: %f' % diff)
 
 try:
     main()
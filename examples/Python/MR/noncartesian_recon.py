@@ -20,6 +20,12 @@ Options:
                               options are cartesian, radial, goldenangle or grpe
                               [default: grpe]
   --recon                     reconstruct iff non-cartesian code was compiled
+  --batch=<glob>              reconstruct all raw data files matching the pattern
+                              in parallel processes (no plots are shown)
+  --nproc=<n>                 number of batch processes; each reconstruction
+                              runs its own OpenMP threads, so using more
+                              processes than CPUs/OMP_NUM_THREADS oversubscribes
+                              the CPUs [default: 2]
   --non-interactive           do not show plots
 '''
 
@@ -48,6 +54,10 @@ args = docopt(__doc__, version=__version__)
 
 #from pUtilities import *
 
+from concurrent.futures import ProcessPoolExecutor
+import glob
+import os
+
 import numpy as np
 import matplotlib.pyplot as plt
 
@@ -66,11 +76,13 @@ output_file = args['--output']
 show_plot = not args['--non-interactive']
 trajtype = args['--traj']
 run_recon = args['--recon']
+batch = args['--batch']
+nproc = int(args['--nproc'])
 
-def main():
+def reconstruct(input_file, show_plot):
 
-    # locate the k-space raw data file adn read
-    input_file = existing_filepath(data_path, data_file)
+    # acquisition data will be read from an HDF file input_file
+    mr.AcquisitionData.set_storage_scheme('memory')
     acq_data = mr.AcquisitionData(input_file)
     
     # pre-process acquisition data
@@ -95,22 +107,31 @@ def main():
                         .format(trajtype))
 
     if show_plot:
-        traj = np.transpose( mr.get_data_trajectory(processed_data))
+        traj = mr.get_data_trajectory(processed_data)
         print("--- traj shape is {}".format(traj.shape))
+        # plot at most 50000 points, denser plots add no information
+        step = max(1, -(-traj.shape[0] // 50000))
         plt.figure()
-        plt.scatter(traj[0,:], traj[1,:], marker='.')
+        plt.scatter(traj[::step, 0], traj[::step, 1], marker='.', s=1)
         plt.show()
 
-    # sort processed acquisition data;
-    print('---\n sorting acquisition data...')
-    processed_data.sort()
-
     if run_recon is True:
+
+        # sort processed acquisition data: this also organises k-space
+        # into the subsets needed by coil images and the acquisition model,
+        # for any trajectory type, hence it is done only if reconstructing
+        print('---\n sorting acquisition data...')
+        processed_data.sort()
     
+        # k-space density weights are needed by both coil sensitivity maps
+        # calculation and inverse(), compute them just once
+        print('---\n computing k-space density weights...')
+        dcw = mr.compute_kspace_density(processed_data)
+
         print('---\n computing coil sensitivity maps...')
         csms = mr.CoilSensitivityData()
         csms.smoothness = 10
-        csms.calculate(processed_data)
+        csms.calculate(processed_data, dcw=dcw)
 
         if show_plot:
         # display coil sensitivity maps
@@ -124,13 +145,14 @@ def main():
         print('---\n Setting up Acquisition Model...')
     
         acq_model = mr.AcquisitionModel()
-        acq_model.set_up(processed_data, csms.copy())
+        # set_up only keeps a reference to the image template, no copy needed
+        acq_model.set_up(processed_data, csms)
         acq_model.set_coil_sensitivity_maps(csms)
     
         print('---\n Backward projection ...')
         #recon_img = acq_model.backward(processed_data)
         bwd_img = acq_model.backward(processed_data)
-        inv_img = acq_model.inverse(processed_data)
+        inv_img = acq_model.inverse(processed_data, dcw)
         
         if show_plot:
             bwd_img.show(title = 'Reconstructed images using backward() (magnitude)')
@@ -139,12 +161,40 @@ def main():
     else:
         print('---\n Skipping non-cartesian code...')
 
-try:
-    main()
-    print('\n=== done with %s' % __file__)
+def reconstruct_file(input_file):
+    '''
+    Batch worker: reconstructs the raw data in input_file without plots.
+    Engine objects are not shared between files because each worker is
+    a separate process.
+    '''
+    reconstruct(input_file, show_plot=False)
+    return input_file
+
+def main():
 
-except error as err:
-    # display error information
-    print('??? %s' % err.value)
-    exit(1)
+    if batch is None:
+        # locate the k-space raw data file and reconstruct
+        input_file = existing_filepath(data_path, data_file)
+        reconstruct(input_file, show_plot)
+        return
+
+    # raw data files are independent, reconstruct them in parallel processes
+    files = sorted(glob.glob(os.path.join(data_path, batch)))
+    if len(files) < 1:
+        raise error('no raw data files matching %s found' % batch)
+    print('---\n reconstructing %d files...' % len(files))
+    with ProcessPoolExecutor(max_workers=nproc) as executor:
+        for input_file in executor.map(reconstruct_file, files):
+            print('---\n done with %s' % input_file)
+
+# worker processes may import this module, only the parent runs main()
+if __name__ == '__main__':
+    try:
+        main()
+        print('\n=== done with %s' % __file__)
+
+    except error as err:
+        # display error information
+        print('??? %s' % err.value)
+        exit(1)
 
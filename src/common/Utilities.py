@@ -202,13 +202,17 @@ def show_3D_array\
         assert rows*cols >= n, \
             "tile rows x columns must be not less than the number of images"
         last_row = (n - 1)//cols
+    magnitude = None
     if scale is None:
         if power is None:
             vmin = numpy.amin(array)
             vmax = numpy.amax(array)
         else:
-            vmin = numpy.power(numpy.amin(abs(array)), power)
-            vmax = numpy.power(numpy.amax(abs(array)), power)
+            # the full magnitude is needed for the display range,
+            # compute it once and reuse it for the tiles
+            magnitude = numpy.abs(array)
+            vmin = numpy.power(numpy.amin(magnitude), power)
+            vmax = numpy.power(numpy.amax(magnitude), power)
     else:
         vmin, vmax = scale
     fig = plt.figure()
@@ -240,7 +244,11 @@ def show_3D_array\
         if power is None:
             imgplot = ax.imshow(array[z,:,:], cmap, vmin=vmin, vmax=vmax)
         else:
-            imgplot = ax.imshow(numpy.power(abs(array[z,:,:]), power), cmap, \
+            if magnitude is None:
+                tile = numpy.abs(array[z,:,:])
+            else:
+                tile = magnitude[z,:,:]
+            imgplot = ax.imshow(numpy.power(tile, power), cmap, \
                                 vmin=vmin, vmax=vmax)
     if show:
         fignums = plt.get_fignums()
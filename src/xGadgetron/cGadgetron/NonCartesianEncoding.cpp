@@ -230,6 +230,19 @@ Gridder2D::TrajectoryArrayType NonCartesian2DEncoding::get_trajectory(const MRAc
     return traj;
 }
 
+static bool same_trajectory(const Gridder2D::TrajectoryArrayType& traj1,
+    const Gridder2D::TrajectoryArrayType& traj2)
+{
+    if (traj1.get_number_of_elements() != traj2.get_number_of_elements())
+        return false;
+
+    for (size_t ik=0; ik<traj1.get_number_of_elements(); ++ik)
+        if (traj1.at(ik)[0] != traj2.at(ik)[0] || traj1.at(ik)[1] != traj2.at(ik)[1])
+            return false;
+
+    return true;
+}
+
 std::vector<int> NonCartesian2DEncoding::get_slice_encoding_subset_indices(const MRAcquisitionData& full_dataset, unsigned int kspace_enc_step_2) const
 {
     ISMRMRD::Acquisition acq;
@@ -281,6 +294,10 @@ void NonCartesian2DEncoding::forward(MRAcquisitionData& ac, const CFImage& img)
 
     std::vector < size_t > img_slice_dims{Nx, Ny};
 
+    // stacks of identical 2D trajectories (e.g. stack-of-stars) share one plan
+    std::unique_ptr<Gridder2D> uptr_nufft;
+    Gridder2D::TrajectoryArrayType plan_traj;
+
 //    #pragma omp parallel
     for(size_t islice=0; islice < NSlice; ++islice)
     {
@@ -290,7 +307,11 @@ void NonCartesian2DEncoding::forward(MRAcquisitionData& ac, const CFImage& img)
         ac.get_subset(*uptr_slice_subset, index_acqs_for_this_slice);
 
         Gridder2D::TrajectoryArrayType traj = this->get_trajectory(*uptr_slice_subset);
-        Gridder2D nufft(img_slice_dims, traj);
+        if (!uptr_nufft || !same_trajectory(traj, plan_traj)) {
+            uptr_nufft.reset(new Gridder2D(img_slice_dims, traj));
+            plan_traj = traj;
+        }
+        const Gridder2D& nufft = *uptr_nufft;
         const size_t num_kdata_pts = traj.get_number_of_elements();
 
         const std::vector< size_t> output_dims{num_kdata_pts,NChannel};
@@ -360,6 +381,10 @@ void NonCartesian2DEncoding::backward(CFImage& img, const MRAcquisitionData& ac)
     std::vector<size_t> img_dimensions{NSlice,Nx,Ny,NChannel};
     CFGThoNDArr img_data(img_dimensions);
 
+    // stacks of identical 2D trajectories (e.g. stack-of-stars) share one plan
+    std::unique_ptr<Gridder2D> uptr_nufft;
+    Gridder2D::TrajectoryArrayType plan_traj;
+
     for(size_t islice=0; islice<NSlice; ++islice)
     {
         uptr_slice_subset->empty();
@@ -386,7 +411,11 @@ void NonCartesian2DEncoding::backward(CFImage& img, const MRAcquisitionData& ac)
         }
        
         std::vector < size_t > img_slice_dims{Nx, Ny};
-        Gridder2D nufft(img_slice_dims, traj);
+        if (!uptr_nufft || !same_trajectory(traj, plan_traj)) {
+            uptr_nufft.reset(new Gridder2D(img_slice_dims, traj));
+            plan_traj = traj;
+        }
+        const Gridder2D& nufft = *uptr_nufft;
 
         for(size_t ichannel=0; ichannel<NChannel; ++ichannel)
         {
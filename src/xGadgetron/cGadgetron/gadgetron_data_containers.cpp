@@ -2676,22 +2676,19 @@ void CoilSensitivitiesVector::combine_images_with_coilmaps(GadgetronImageData& c
 
 		for(auto it=ptr_dst_img->begin(); it!=ptr_dst_img->end(); ++it)	
 			*it = complex_float_t(0.f,0.f);
-		
-		// conjugate the coilmap
-		for(auto it=coilmap.begin(); it!=coilmap.end(); ++it)
-			*it = std::conj(*it);
-
-
-		// multiply with image
-		std::transform( coilmap.begin(), coilmap.end(),
-						ptr_src_img->getDataPtr(), coilmap.begin(), 
-						std::multiplies<complex_float_t>());
 
-        for( size_t nc=0;nc<Nc ; nc++)
-        for( size_t nz=0;nz<Nz ; nz++)
-        for( size_t ny=0;ny<Ny ; ny++)
-        for( size_t nx=0;nx<Nx ; nx++)
-	        ptr_dst_img->operator() (nx, ny, nz, 0) += coilmap(nx,ny,nz,nc);
+		// accumulate conj(coilmap) * image over coils in a single pass
+		// rather than conjugating and multiplying the coilmap in place first
+		const complex_float_t* ptr_src = ptr_src_img->getDataPtr();
+		const complex_float_t* ptr_csm = coilmap.getDataPtr();
+		complex_float_t* ptr_dst = ptr_dst_img->getDataPtr();
+		size_t const Nxyz = (size_t)Nx * Ny * Nz;
+
+		for (size_t nc = 0; nc < Nc; nc++) {
+			const size_t offset = nc * Nxyz;
+			for (size_t i = 0; i < Nxyz; i++)
+				ptr_dst[i] += std::conj(ptr_csm[offset + i]) * ptr_src[offset + i];
+		}
 
         combined_img.append(iw_dst);
     }
@@ -2790,23 +2787,16 @@ void CoilSensitivitiesVector::calculate_csm
         smoothen_(nx, ny, nz, nc, cm0.getDataPtr(), w.getDataPtr(), //0, 1);
             object_mask, 1);
 
-    for (unsigned int z = 0; z < nz; z++) {
-        for (unsigned int y = 0; y < ny; y++) {
-            for (unsigned int x = 0; x < nx; x++) {
-                float r = 0.0;
-                for (unsigned int c = 0; c < nc; c++) {
-                    float s = std::abs(cm0(x, y, z, c));
-                    r += s*s;
-                }
-                img(x, y, z) = (float)std::sqrt(r);
-            }
-        }
-    }
-
+    // compute the SRSS of the smoothed coil images and normalise them by it
+    // in the same loop over pixels, so that the coil axis is traversed once
     for (unsigned int z = 0, i = 0; z < nz; z++) {
         for (unsigned int y = 0; y < ny; y++) {
             for (unsigned int x = 0; x < nx; x++, i++) {
-                float r = img(x, y, z);
+                float r = 0.0;
+                for (unsigned int c = 0; c < nc; c++)
+                    r += std::norm(cm0(x, y, z, c));
+                r = (float)std::sqrt(r);
+                img(x, y, z) = r;
                 float s;
                 if (r != 0.0 && object_mask[i])
                     s = (float)(1.0 / r);
@@ -474,7 +474,8 @@ class ImageData(SIRF.ImageData):
         if not HAVE_PYLAB:
             print('pylab not found')
             return
-        data = self.as_array()
+        # magnitude is computed once for all figures
+        data = numpy.abs(self.as_array())
         nz = data.shape[0]
         if isinstance(slice, (Integral,numpy.integer)):
             if slice < 0 or slice >= nz:
@@ -498,7 +499,7 @@ class ImageData(SIRF.ImageData):
         f = 0
         while f < ni:
             t = min(f + 16, ni)
-            err = show_3D_array(abs(data), index=slice[f : t], \
+            err = show_3D_array(data, index=slice[f : t], \
                                 tile_shape=tiles, cmap=cmap, \
                                 zyx=zyx, label='image', \
                                 xlabel='samples', ylabel='readouts', \
@@ -531,8 +532,15 @@ class CoilImagesData(ImageData):
             pyiutil.deleteDataHandle(self.handle)
     def same_object(self):
         return CoilImagesData()
-    def calculate(self, acq):
-        dcw = compute_kspace_density(acq)
+    def calculate(self, acq, dcw=None):
+        '''
+        Calculates coil images from acquisitions.
+        acq: AcquisitionData
+        dcw: AcquisitionData with k-space density weights, computed from acq
+             if not present
+        '''
+        if dcw is None:
+            dcw = compute_kspace_density(acq)
         acq = acq * dcw
         try_calling(pygadgetron.cGT_computeCoilImages(self.handle, acq.handle))
 
@@ -558,13 +566,15 @@ class CoilSensitivityData(ImageData):
             pyiutil.deleteDataHandle(self.handle)
         self.handle = pygadgetron.cGT_CoilSensitivities(file)
         check_status(self.handle)
-    def calculate(self, data, method=None):
+    def calculate(self, data, method=None, dcw=None):
         '''
         Calculates coil sensitivity maps from coil images or sorted
         acquisitions.
         data  : either AcquisitionData or CoilImages
         method: either SRSS (Square Root of the Sum of Squares, default) or
                 Inati
+        dcw   : AcquisitionData with k-space density weights for data being
+                AcquisitionData, computed from data if not present
         '''
         if isinstance(data, AcquisitionData):
             if data.is_sorted() is False:
@@ -587,19 +597,20 @@ class CoilSensitivityData(ImageData):
         parms.set_int_par(self.handle, 'coil_sensitivity', 'smoothness', nit)
 
         if isinstance(data, AcquisitionData):
-            self.__calc_from_acquisitions(data, method_name)
+            self.__calc_from_acquisitions(data, method_name, dcw)
         elif isinstance(data, CoilImagesData):
             self.__calc_from_images(data, method_name)
         else:
             raise error('Cannot calculate coil sensitivities from %s' % \
                         repr(type(data)))
 
-    def __calc_from_acquisitions(self, data, method_name):
+    def __calc_from_acquisitions(self, data, method_name, dcw=None):
 
         if data.handle is None:
             raise AssertionError("The handle for data is None. Please pass valid acquisition data.")
 
-        dcw = compute_kspace_density(data)
+        if dcw is None:
+            dcw = compute_kspace_density(data)
 
         data = data * dcw
         if method_name == 'Inati':
@@ -618,7 +629,7 @@ class CoilSensitivityData(ImageData):
                 pyiutil.deleteDataHandle(self.handle)
             self.handle = pysirf.cSIRF_clone(cis.handle)
 
-            self.fill(csm.astype(numpy.complex64))
+            self.fill(csm.astype(numpy.complex64, copy=False))
         
         elif method_name == 'SRSS':
             try_calling(pygadgetron.cGT_computeCoilSensitivities(self.handle, data.handle))
@@ -642,7 +653,7 @@ class CoilSensitivityData(ImageData):
                 pyiutil.deleteDataHandle(self.handle)
             self.handle = pysirf.cSIRF_clone(data.handle)
 
-            self.fill(csm.astype(numpy.complex64))
+            self.fill(csm.astype(numpy.complex64, copy=False))
 
         elif method_name == 'SRSS':
 
@@ -652,9 +663,10 @@ class CoilSensitivityData(ImageData):
         else:
             raise error('Unknown method %s' % method_name)
 
-    def __calc_from_acquisitions(self, data, method_name):
+    def __calc_from_acquisitions(self, data, method_name, dcw=None):
         assert data.handle is not None
-        dcw = compute_kspace_density(data)
+        if dcw is None:
+            dcw = compute_kspace_density(data)
         data = data * dcw
         cis = CoilImagesData()
         try_calling(pygadgetron.cGT_computeCoilImages(cis.handle, data.handle))
@@ -1121,7 +1133,12 @@ class AcquisitionData(DataContainer):
         if not HAVE_PYLAB:
             print('pylab not found')
             return
-        data = numpy.transpose(self.as_array(), (1, 0, 2))
+        # magnitude, its power and the display range are computed once
+        # for all figures
+        data = numpy.abs(numpy.transpose(self.as_array(), (1, 0, 2)))
+        if power is not None:
+            numpy.power(data, power, out=data)
+        scale = (numpy.amin(data), numpy.amax(data))
         nz = data.shape[0]
         if isinstance(slice, (Integral,numpy.integer)):
             if slice < 0 or slice >= nz:
@@ -1147,11 +1164,11 @@ class AcquisitionData(DataContainer):
         f = 0
         while f < ns:
             t = min(f + 16, ns)
-            err = show_3D_array(abs(data), index = slice[f : t], \
+            err = show_3D_array(data, index = slice[f : t], \
                                 tile_shape = tiles, \
                                 label = 'coil', xlabel = 'samples', \
                                 ylabel = 'readouts', \
-                                suptitle = title, cmap = cmap, power = power, \
+                                suptitle = title, cmap = cmap, scale = scale, \
                                 show = (t == ns) and not postpone)
             f = t
     
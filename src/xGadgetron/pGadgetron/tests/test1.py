@@ -47,6 +47,11 @@ def test_main(rec=False, verb=False, throw=True):
 
     processed_data.sort()
     csms.calculate(processed_data)
+    dcw = compute_kspace_density(processed_data)
+    csms_dcw = CoilSensitivityData()
+    csms_dcw.calculate(processed_data, dcw=dcw)
+    diff = csms_dcw - csms
+    test.check_if_equal(0, diff.norm())
     am = AcquisitionModel(processed_data, csms)
     am.set_coil_sensitivity_maps(csms)
     fwd_acqs = am.forward(complex_images)